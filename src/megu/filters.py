@@ -2,91 +2,46 @@
 # Copyright (c) 2021 Stephen Bunn <stephen@bunn.io>
 # GPLv3 License <https://choosealicense.com/licenses/gpl-3.0/>
 
-"""Contains some really basic content filters."""
+"""Contains some really basic content filters.
 
-from functools import partial
-from itertools import groupby
-from typing import Any, Callable, Dict, Iterable, List
+Attributes:
+    CONTENT_FILTER_KEYS (Tuple[str, ...]):
+        The content attributes that :func:`~specific_content` is able to filter on.
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, Iterable
 
 from .log import instance as log
 from .models import Content
-from .utils import compose_functions
+
+CONTENT_FILTER_KEYS = ("quality", "type")
 
 
 def best_content(content: Iterable[Content]) -> Iterable[Content]:
     """Get the best quality content from the extracted content iterator.
 
+    .. note::
+        The given content is consumed entirely before any content is yielded.
+
     Args:
         content (Iterable[~models.content.Content]):
             The iterable of content that was extracted
 
     Returns:
         ~models.content.Content:
-            The highest quality content
-    """
-
-    for _, content_items in groupby(content, key=lambda c: c.id):
-        yield max(content_items, key=lambda c: c.quality)
-
-
-def _filter_type(type: str, content_iterator: Iterable[Content]) -> Iterable[Content]:
-    """Filter out content that does not match the provided type.
-
-    Args:
-        type (str):
-            The desired type of content.
-        content_iterator (Iterable[Content]):
-            The content iterable that should be filtered.
-
-    Returns:
-        Iterable[Content]:
-            An iterator for type filtered content.
-
-    Yields:
-        Content:
-            Content filtered to match the provided type.
-    """
-
-    for content in content_iterator:
-        if content.type != type:
-            log.debug(
-                f"Filtering out content {content} due to mismatched type "
-                f"({content.type!r} != {type!r})"
-            )
-            continue
-
-        yield content
-
-
-def _filter_quality(
-    quality: float, content_iterator: Iterable[Content]
-) -> Iterable[Content]:
-    """Filter out content that does not match the provided quality.
-
-    Args:
-        quality (float):
-            The desired quality of content.
-        content_iterator (Iterable[Content]):
-            The content iterable that should be filtered.
-
-    Returns:
-        Iterable[Content]:
-            An iterator for quality filtered content.
-
-    Yields:
-        Content:
-            Content filtered to match the provided quality.
+            The highest quality content for each unique content id
     """
 
-    for content in content_iterator:
-        if content.quality != quality:
-            log.debug(
-                f"Filtering out content {content} due to mismatched quality "
-                f"({content.quality!r} != {quality!r})"
-            )
-            continue
+    # a single pass keeping the best content seen for each id, this also handles content
+    # for the same id that is not extracted back-to-back
+    best: Dict[str, Content] = {}
+    for content_item in content:
+        current = best.get(content_item.id)
+        if current is None or content_item.quality > current.quality:
+            best[content_item.id] = content_item
 
-        yield content
+    yield from best.values()
 
 
 def specific_content(content: Iterable[Content], **conditions) -> Iterable[Content]:
@@ -94,8 +49,8 @@ def specific_content(content: Iterable[Content], **conditions) -> Iterable[Conte
 
     With no conditions provided, no content will be filtered out and all content
     instances will be returned.
-    When conditions are provided, matching filter handlers will be dynamically applied
-    to filter out content instances.
+    When conditions are provided, content instances whose matching attributes are not
+    equal to the provided values will be filtered out.
 
     Args:
         content (Iterable[Content]):
@@ -112,17 +67,29 @@ def specific_content(content: Iterable[Content], **conditions) -> Iterable[Conte
             Content instances which have passed all defined filters.
     """
 
-    handlers: Dict[str, Callable[[Any, Iterable[Content]], Iterable[Content]]] = {
-        "quality": _filter_quality,
-        "type": _filter_type,
-    }
-
-    filters: List[Callable[[Iterable[Content]], Iterable[Content]]] = []
+    filters: Dict[str, Any] = {}
     for key, value in conditions.items():
-        if key not in handlers:
+        if key not in CONTENT_FILTER_KEYS:
             log.warning(f"No such content filter for key {key!r} is defined")
             continue
 
-        filters.append(partial(handlers[key], value))
+        filters[key] = value
+
+    if len(filters) <= 0:
+        yield from content
+        return
+
+    # a single attrgetter fetches every filtered attribute at once, returning a tuple
+    # only when more than one attribute is requested
+    getter = attrgetter(*filters.keys())
+    expected = tuple(filters.values()) if len(filters) > 1 else [*filters.values()][0]
+    for content_item in content:
+        actual = getter(content_item)
+        if actual != expected:
+            log.debug(
+                f"Filtering out content {content_item} due to mismatched "
+                f"{tuple(filters.keys())!r} ({actual!r} != {expected!r})"
+            )
+            continue
 
-    yield from compose_functions(*filters)(content)
+        yield content_item
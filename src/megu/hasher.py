@@ -22,22 +22,48 @@ they have several that are never really used (such as ``sha224``).
 Attributes:
     DEFAULT_CHUNK_SIZE (int):
         The default size in bytes to chunk file streams for hashing.
+    MMAP_THRESHOLD (int):
+        The size in bytes at which files are memory-mapped for hashing rather than
+        being read through in chunks.
+    PARALLEL_THRESHOLD (int):
+        The size in bytes at which a buffer is fed to multiple hashers concurrently
+        rather than one after another.
+    TREE_SEGMENT_SIZE (int):
+        The size in bytes of the independent segments hashed by
+        :attr:`~HashType.SHA256_TREE`.
 """
 
 import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from enum import Enum
 from pathlib import Path
-from typing import IO, BinaryIO, Callable, Dict, Set, Union
+from typing import IO, BinaryIO, Callable, Collection, Dict, List, Set, Union
 
 from .log import instance as log
 
 Hasher_T = Callable[[Union[bytes, bytearray, memoryview]], "hashlib._Hash"]
 
 DEFAULT_CHUNK_SIZE = 2 ** 16
+MMAP_THRESHOLD = 10 * 2 ** 20
+PARALLEL_THRESHOLD = 2 ** 16
+TREE_SEGMENT_SIZE = 16 * 2 ** 20
+
+_CPU_COUNT = os.cpu_count() or 1
 
 
 class HashType(Enum):
-    """Enumeration of supported hash types."""
+    """Enumeration of supported hash types.
+
+    .. note::
+        :attr:`~HashType.SHA256_TREE` is **not** a plain SHA-256 digest of the content.
+        It is the SHA-256 digest of the concatenated SHA-256 digests of each
+        :attr:`~TREE_SEGMENT_SIZE` segment of the content, which allows the segments
+        of large files to be hashed concurrently.
+        Use :attr:`~HashType.SHA256` if you need a digest comparable with other tools.
+    """
 
     MD5 = "md5"
     SHA1 = "sha1"
@@ -45,27 +71,196 @@ class HashType(Enum):
     SHA512 = "sha512"
     BLAKE2B = "blake2b"
     BLAKE2S = "blake2s"
-
-    # NOTE: Enums still consider class-mangled class properties as values in the
-    # enumeration. So you can do HashType._HashType__available_hashers or
-    # HashType("__available_hashers") and it's *technically* valid.
-    __available_hashers: Dict[str, Hasher_T] = {
-        MD5: hashlib.md5,
-        SHA1: hashlib.sha1,
-        SHA256: hashlib.sha256,
-        SHA512: hashlib.sha512,
-        BLAKE2B: hashlib.blake2b,
-        BLAKE2S: hashlib.blake2s,
-    }
+    SHA256_TREE = "sha256_tree"
 
     @property
     def hasher(self) -> Hasher_T:
         """Get the hasher callable for the current hash type."""
 
-        # The type of this __available_hashers is no longer a dict due to it being
-        # coerced into a enumeration property on the instance. That is why we are having
-        # to access it through .value here.
-        return self.__available_hashers.value[self.value]  # type: ignore
+        if self is HashType.SHA256_TREE:
+            return _TreeHash  # type: ignore
+
+        # NOTE: the named hashlib constructors are bound to OpenSSL's implementations
+        # whenever Python is built against it, so we get whatever hardware
+        # acceleration (such as SHA-NI) OpenSSL is able to dispatch to on this CPU
+        return getattr(hashlib, self.value)
+
+
+# hashlib releases the GIL while hashing large buffers, so multiple hashers can be
+# updated at the same time from threads (workers are only spawned once first used)
+_hasher_executor = ThreadPoolExecutor(
+    max_workers=len(HashType), thread_name_prefix="megu-hasher"
+)
+
+
+# segments are hashed on their own executor as tree hashes may be updated from within
+# the hasher executor and we don't want to wait on work queued behind ourselves
+_segment_executor = ThreadPoolExecutor(
+    max_workers=_CPU_COUNT, thread_name_prefix="megu-hasher-segment"
+)
+
+
+class _TreeHash:
+    """Hash instance calculating a SHA-256 tree digest over fixed size segments."""
+
+    name = HashType.SHA256_TREE.value
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview] = b""):
+        """Initialize the tree hash instance.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview], optional):
+                The initial data to update the tree hash with.
+                Defaults to no data.
+        """
+
+        self._digests: List[bytes] = []
+        self._segment = hashlib.sha256()
+        self._segment_size = 0
+        self.update(data)
+
+    def _hash_segments(self, view: memoryview):
+        """Hash the whole segments of the given view, concurrently when possible.
+
+        Args:
+            view (memoryview):
+                The view whose length is a multiple of :attr:`~TREE_SEGMENT_SIZE`.
+        """
+
+        segments = [
+            view[offset : offset + TREE_SEGMENT_SIZE]
+            for offset in range(0, len(view), TREE_SEGMENT_SIZE)
+        ]
+        if _CPU_COUNT <= 1 or len(segments) <= 1:
+            self._digests.extend(
+                hashlib.sha256(segment).digest() for segment in segments
+            )
+            return
+
+        self._digests.extend(
+            _segment_executor.map(
+                lambda segment: hashlib.sha256(segment).digest(), segments
+            )
+        )
+
+    def update(self, data: Union[bytes, bytearray, memoryview]):
+        """Update the tree hash with the given data.
+
+        Args:
+            data (Union[bytes, bytearray, memoryview]):
+                The data to update the tree hash with.
+        """
+
+        view = memoryview(data).cast("B")
+        if self._segment_size > 0:
+            remaining = min(len(view), TREE_SEGMENT_SIZE - self._segment_size)
+            self._segment.update(view[:remaining])
+            self._segment_size += remaining
+            view = view[remaining:]
+
+            if self._segment_size < TREE_SEGMENT_SIZE:
+                return
+
+            self._digests.append(self._segment.digest())
+            self._segment = hashlib.sha256()
+            self._segment_size = 0
+
+        whole_size = len(view) - (len(view) % TREE_SEGMENT_SIZE)
+        if whole_size > 0:
+            self._hash_segments(view[:whole_size])
+
+        if whole_size < len(view):
+            self._segment.update(view[whole_size:])
+            self._segment_size = len(view) - whole_size
+
+    def digest(self) -> bytes:
+        """Get the tree digest of the data the hash has been updated with.
+
+        Returns:
+            bytes:
+                The SHA-256 digest of the concatenated segment digests.
+        """
+
+        digests = self._digests
+        if self._segment_size > 0 or len(digests) <= 0:
+            digests = [*digests, self._segment.digest()]
+
+        return hashlib.sha256(b"".join(digests)).digest()
+
+    def hexdigest(self) -> str:
+        """Get the tree digest as a string of hexadecimal digits.
+
+        Returns:
+            str:
+                The hexadecimal SHA-256 digest of the concatenated segment digests.
+        """
+
+        return self.digest().hex()
+
+
+def _update_hashers(
+    hashers: Collection["hashlib._Hash"],
+    data: Union[bytes, bytearray, memoryview],
+):
+    """Feed the same data to many hashers, concurrently when it is worth the overhead.
+
+    Args:
+        hashers (Collection[hashlib._Hash]):
+            The hash instances to update.
+        data (Union[bytes, bytearray, memoryview]):
+            The data to update the hash instances with.
+    """
+
+    if _CPU_COUNT <= 1 or len(hashers) <= 1 or len(data) < PARALLEL_THRESHOLD:
+        for hash_instance in hashers:
+            hash_instance.update(data)
+        return
+
+    for future in [
+        _hasher_executor.submit(hash_instance.update, data) for hash_instance in hashers
+    ]:
+        future.result()
+
+
+def hash_bytes(
+    data: Union[bytes, bytearray, memoryview],
+    types: Set[HashType],
+) -> Dict[HashType, str]:
+    """Calculate the requested hash types for some given in-memory bytes.
+
+    Prefer this over :func:`~hash_io` when the content is already in memory as it
+    hashes the whole buffer at once rather than wrapping it in a
+    :class:`~io.BytesIO` and reading it back out in chunks.
+
+    >>> from megu.hasher import hash_bytes, HashType
+    >>> hash_bytes(b"Hey, I'm a string", {HashType.SHA256, HashType.MD5})
+    {
+        <HashType.SHA256: 'sha256'>: 'f0e4c2f76c58916ec258f246851bea091d14d4247a2f...',
+        <HashType.MD5: 'md5'>: '25cb7b2c4e2064c1deebac4b66195c9c'
+    }
+
+    Args:
+        data (Union[bytes, bytearray, memoryview]):
+            The bytes to calculate hashes for.
+        types (Set[~HashType]):
+            The set of names for hash types to calculate.
+
+    Raises:
+        ValueError:
+            If one of the given types is not supported.
+
+    Returns:
+        Dict[~HashType, str]:
+            A dictionary of hash type strings and the calculated hexdigest of the hash.
+    """
+
+    log.debug(f"Hashing {len(data)!s} bytes with types {types!r}")
+    hashers: Dict[HashType, "hashlib._Hash"] = {
+        hash_type: hash_type.hasher() for hash_type in types  # type: ignore
+    }
+
+    _update_hashers(hashers.values(), data)
+    return {key: value.hexdigest() for key, value in hashers.items()}
 
 
 def hash_io(
@@ -120,11 +315,22 @@ def hash_io(
         hash_type: hash_type.hasher() for hash_type in types  # type: ignore
     }
 
-    chunk: bytes = io.read(chunk_size)
-    while chunk:
-        for hash_instance in hashers.values():
-            hash_instance.update(chunk)
-        chunk = io.read(chunk_size)
+    if not hasattr(io, "readinto"):
+        chunk: bytes = io.read(chunk_size)
+        while chunk:
+            _update_hashers(hashers.values(), chunk)
+            chunk = io.read(chunk_size)
+
+        return {key: value.hexdigest() for key, value in hashers.items()}
+
+    # reuse a single buffer for every chunk rather than allocating new bytes per read,
+    # this is safe as the hashers are always done with a chunk before the next read
+    buffer = bytearray(chunk_size)
+    with memoryview(buffer) as view:
+        read_size = io.readinto(buffer)  # type: ignore
+        while read_size:
+            _update_hashers(hashers.values(), view[:read_size])
+            read_size = io.readinto(buffer)  # type: ignore
 
     return {key: value.hexdigest() for key, value in hashers.items()}
 
@@ -136,6 +342,11 @@ def hash_file(
 ) -> Dict[HashType, str]:
     """Calculate the requested hash types for some given file path instance.
 
+    Files that fit within a single chunk are read in one go, and files of at least
+    :attr:`~MMAP_THRESHOLD` bytes are memory-mapped and handed to the hashers
+    directly. Everything else (or any file that fails to map) is streamed through
+    :func:`~hash_io` in chunks, advising the OS of the sequential read when supported.
+
     Basic usage of this function typically looks like the following:
 
     >>> from pathlib import Path
@@ -170,5 +381,27 @@ def hash_file(
     if not filepath.is_file():
         raise FileNotFoundError(f"No such file {filepath!s} exists")
 
+    file_size = filepath.stat().st_size
     with filepath.open("rb") as file_io:
+        if file_size <= chunk_size:
+            return hash_bytes(file_io.read(), types)
+
+        if file_size >= MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(
+                    file_io.fileno(), 0, access=mmap.ACCESS_READ
+                ) as file_map:
+                    return hash_bytes(file_map, types)  # type: ignore
+            except (OSError, ValueError) as exc:
+                log.debug(
+                    f"Failed to memory-map {filepath!s} for hashing ({exc!s}), "
+                    "falling back to chunked reads"
+                )
+
+        if hasattr(os, "posix_fadvise"):
+            # let the kernel know we are going to read through the entire file so it
+            # can more aggressively read ahead while we are busy hashing chunks
+            with suppress(OSError):
+                os.posix_fadvise(file_io.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
         return hash_io(io=file_io, types=types, chunk_size=chunk_size)  # type: ignore
@@ -2,24 +2,47 @@
 # Copyright (c) 2021 Stephen Bunn <stephen@bunn.io>
 # GPLv3 License <https://choosealicense.com/licenses/gpl-3.0/>
 
-"""Contains helper methods that plugins can use to simplify usage."""
+"""Contains helper methods that plugins can use to simplify usage.
+
+Attributes:
+    DISK_CACHE_PATTERN (re.Pattern):
+        The pattern that disk cache names must fully match.
+    HTTP_POOL_CONNECTIONS (int):
+        The number of per-host connection pools kept by the shared HTTP adapter.
+    HTTP_POOL_MAXSIZE (int):
+        The maximum number of kept-alive connections per host in the shared HTTP
+        adapter.
+    SOUP_MEDIA_STRAINER (~bs4.SoupStrainer):
+        A strainer for :func:`~get_soup` that only parses link and media tags.
+"""
 
 import re
 import sys
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import IO, Generator, List, Optional, Tuple
+from typing import IO, Generator, Iterable, List, Optional, Tuple, Union
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from diskcache import Cache
 from requests import Session
+from requests.adapters import HTTPAdapter
 
 from .config import instance as config
 from .log import instance as log
 
 DISK_CACHE_PATTERN = re.compile(r"^[a-z]+[a-z0-9_-]{3,31}[a-z0-9]$")
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+SOUP_MEDIA_STRAINER = SoupStrainer(["a", "source", "video", "audio"])
+
+# connections are pooled (and kept alive) across every session created by the
+# http_session helper so that plugins don't reconnect to the same hosts for each session
+_http_adapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+)
 
 
 class noop_class:
@@ -47,17 +70,41 @@ def noop(*args, **kwargs) -> None:
     return None
 
 
+@lru_cache(maxsize=1024)
+def _is_valid_cache_name(cache_name: str) -> bool:
+    """Check if the given cache name matches the required disk cache naming pattern.
+
+    Args:
+        cache_name (str):
+            The name of the cache to check.
+
+    Returns:
+        bool:
+            True if the cache name fully matches the disk cache naming pattern.
+    """
+
+    return DISK_CACHE_PATTERN.fullmatch(cache_name) is not None
+
+
 @contextmanager
 def http_session() -> Generator[Session, None, None]:
     """Context manager for creating a requests HTTP session to make basic requests.
 
+    .. note::
+        Each session has its own clean state (headers, cookies, etc.), but all sessions
+        share the same pool of kept-alive connections.
+        For this reason the shared connections are not closed when the context exits.
+
     Yields:
         :class:`~requests.Session`:
             A new clean session that plugins can use for requests.
     """
 
-    with Session() as session:
-        yield session
+    session = Session()
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, _http_adapter)
+
+    yield session
 
 
 @contextmanager
@@ -95,7 +142,7 @@ def disk_cache(cache_name: str) -> Generator[Cache, None, None]:
             The diskcache Cache instance.
     """
 
-    if not DISK_CACHE_PATTERN.match(cache_name):
+    if not _is_valid_cache_name(cache_name):
         raise ValueError(
             f"Disk cache name {cache_name!r} violates the required naming pattern "
             f"{DISK_CACHE_PATTERN.pattern!r}"
@@ -197,43 +244,71 @@ def python_path(*paths: PathLike) -> Generator[List[str], None, None]:
             The temporarily mutated ``sys.path``.
     """
 
-    original_paths = sys.path.copy()
+    inserted_paths: List[str] = []
     try:
-        if len(paths) <= 0:
-            yield sys.path
-        else:
-            for directory_name in paths:
-                directory_path = Path(directory_name).expanduser().resolve()
-                if not directory_path.is_dir():
-                    log.warning(
-                        f"Skipping inserting the directory {directory_path!s} into the "
-                        "Python path, is not a directory"
-                    )
-                    continue
-                if directory_path.as_posix() in sys.path:
-                    continue
-
-                log.debug(
-                    f"Inserting directory {directory_path!s} into the Python path"
+        for directory_name in paths:
+            directory_path = Path(directory_name).expanduser().resolve()
+            if not directory_path.is_dir():
+                log.warning(
+                    f"Skipping inserting the directory {directory_path!s} into the "
+                    "Python path, is not a directory"
                 )
-                sys.path.insert(0, directory_path.as_posix())
+                continue
+            if directory_path.as_posix() in sys.path:
+                continue
+
+            log.debug(f"Inserting directory {directory_path!s} into the Python path")
+            sys.path.insert(0, directory_path.as_posix())
+            inserted_paths.append(directory_path.as_posix())
 
-            yield sys.path
+        yield sys.path
     finally:
+        # only undo our own insertions (in place) rather than copying and restoring the
+        # entire Python path
         log.debug("Restoring original Python path")
-        sys.path = original_paths
+        for inserted_path in inserted_paths:
+            with suppress(ValueError):
+                sys.path.remove(inserted_path)
 
 
-def get_soup(markup: str) -> BeautifulSoup:
+def get_soup(
+    markup: str, tags: Optional[Union[str, Iterable[str], SoupStrainer]] = None
+) -> BeautifulSoup:
     """Get a BeautifulSoup instance for some HTML markup.
 
+    If you only need a few specific tags from the markup, providing them through
+    ``tags`` will skip building the rest of the document tree which is much faster
+    for large pages.
+    The :attr:`~SOUP_MEDIA_STRAINER` is provided for the common case of only needing
+    links and media tags.
+
+    >>> from megu.helpers import get_soup, SOUP_MEDIA_STRAINER
+    >>> soup = get_soup(markup, SOUP_MEDIA_STRAINER)
+
     Args:
         markup (str):
             The HTML markup to use when building a BeautifulSoup instance.
+        tags (Optional[Union[str, Iterable[str], ~bs4.SoupStrainer]], optional):
+            The tag names (or strainer) that should only be parsed from the markup.
+            Defaults to None which parses the entire markup.
 
     Returns:
         ~bs4.BeautifulSoup:
             The parsed soup for the given HTML markup.
     """
 
-    return BeautifulSoup(markup=markup, features="lxml")
+    parse_only: Optional[SoupStrainer] = None
+    if tags is not None:
+        parse_only = (
+            tags
+            if isinstance(tags, SoupStrainer)
+            else SoupStrainer(tags if isinstance(tags, str) else [*tags])
+        )
+
+    try:
+        return BeautifulSoup(markup=markup, features="lxml", parse_only=parse_only)
+    except FeatureNotFound:
+        log.debug("Parser lxml is unavailable, falling back to builtin html.parser")
+        return BeautifulSoup(
+            markup=markup, features="html.parser", parse_only=parse_only
+        )
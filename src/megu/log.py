@@ -38,7 +38,7 @@ from __future__ import annotations
 
 import sys
 from functools import lru_cache
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import loguru
 
@@ -61,6 +61,36 @@ DEFAULT_STDOUT_HANDLER = dict(
 )
 
 
+@lru_cache(maxsize=8)
+def _get_handlers(level: str, debug: bool, record: bool) -> Tuple[Dict[str, Any], ...]:
+    """Get the logger handler definitions for the given logger configuration.
+
+    Args:
+        level (str):
+            The string level to filter logging messages through.
+        debug (bool):
+            If True, builds the handlers with the debug configuration.
+        record (bool):
+            If True, includes the handler recording logs to the log directory.
+
+    Returns:
+        Tuple[Dict[str, Any], ...]:
+            The handler definitions to configure the logger with.
+    """
+
+    handlers: List[Dict[str, Any]] = [
+        {
+            **DEFAULT_STDOUT_HANDLER,
+            **dict(level=level, diagnose=debug, backtrace=debug),
+        }
+    ]
+
+    if record:
+        handlers.append(DEFAULT_RECORD_HANDLER)
+
+    return tuple(handlers)
+
+
 def configure_logger(
     logger: loguru.Logger,
     level: str = "CRITICAL",
@@ -87,17 +117,7 @@ def configure_logger(
             The newly configured global logger
     """
 
-    handlers: List[Dict[str, Any]] = [
-        {
-            **DEFAULT_STDOUT_HANDLER,
-            **dict(level=level, diagnose=debug, backtrace=debug),
-        }
-    ]
-
-    if record:
-        handlers.append(DEFAULT_RECORD_HANDLER)
-
-    logger.configure(handlers=handlers)
+    logger.configure(handlers=[*_get_handlers(level, debug, record)])
     return logger.bind(version=config.app_version)
 
 
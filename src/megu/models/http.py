@@ -6,8 +6,8 @@
 
 from __future__ import annotations
 
+import hashlib
 from enum import Enum
-from io import BytesIO
 from typing import Callable, Optional
 
 from cached_property import cached_property
@@ -15,7 +15,6 @@ from pydantic import Field
 from requests import PreparedRequest
 from requests.sessions import Request
 
-from ..hasher import HashType, hash_io
 from ..log import instance as log
 from .content import Resource
 from .types import Url
@@ -111,10 +110,9 @@ class HttpResource(Resource):
                 The unique identifier for the resource.
         """
 
-        fingerprint = hash_io(
-            BytesIO(self._get_signature()),
-            {HashType.MD5},
-        )[HashType.MD5]
+        # a 16 byte blake2b digest keeps the same length as the previous md5 fingerprint
+        # while being faster to compute for every resource
+        fingerprint = hashlib.blake2b(self._get_signature(), digest_size=16).hexdigest()
         log.debug(f"Computed fingerprint {fingerprint!r} for resource {self!r}")
 
         return fingerprint
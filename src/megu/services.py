@@ -5,8 +5,9 @@
 """Contains helpful service functions that should really only be used during runtime."""
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional, Union
+from typing import Generator, List, Optional, Tuple, Union
 
 from .config import instance as config
 from .download import BaseDownloader, discover_downloaders
@@ -17,6 +18,9 @@ from .models import Content, Manifest, Url
 from .plugin import BasePlugin, iter_available_plugins
 from .plugin.generic import GenericPlugin
 
+# the generic plugin is stateless, so a single instance is shared as the fallback plugin
+_generic_plugin = GenericPlugin()
+
 
 def normalize_url(url: Union[str, Url]) -> Url:
     """Normalize a given URL to a formatted Url instance.
@@ -37,12 +41,36 @@ def normalize_url(url: Union[str, Url]) -> Url:
     return Url(url)
 
 
+@lru_cache(maxsize=8)
+def _get_available_plugins(dirpath: Path) -> Tuple[Tuple[str, List[BasePlugin]], ...]:
+    """Discover (and remember) the available plugins from a directory of plugins.
+
+    Discovering plugins imports every plugin module from disk, so this is only done
+    once per plugin directory rather than for every URL that needs a plugin.
+
+    Args:
+        dirpath (~pathlib.Path):
+            The path to the directory of plugins to read through.
+
+    Returns:
+        Tuple[Tuple[str, List[~megu.plugin.BasePlugin]], ...]:
+            The tuples of plugin names and their exported plugin instances.
+    """
+
+    return tuple(iter_available_plugins(plugin_dirpath=dirpath))
+
+
 def get_plugin(
     url: Union[str, Url],
     plugin_dirpath: Optional[Path] = None,
 ) -> BasePlugin:
     """Get the best available plugin for a given url.
 
+    .. note::
+        Plugins are only discovered once per plugin directory for the lifetime of the
+        process, so the same plugin instances are reused between calls and plugins
+        installed afterwards are only picked up by a new process.
+
     Args:
         url (Union[str, ~megu.models.content.Url]):
             The URL string to fetch the appropriate plugin for.
@@ -64,7 +92,7 @@ def get_plugin(
         f"Determining which plugin from {dirpath.as_posix()!r} can handle "
         f"URL {url.url!r}"
     )
-    for plugin_name, plugins in iter_available_plugins(plugin_dirpath=dirpath):
+    for plugin_name, plugins in _get_available_plugins(dirpath):
         for plugin in plugins:
             with log.contextualize(plugin_name=plugin_name, plugin=plugin):
                 if url.netloc not in plugin.domains:
@@ -88,7 +116,7 @@ def get_plugin(
         f"No plugin found that can handle {url.url!r}, "
         f"falling back to {GenericPlugin!r}"
     )
-    return GenericPlugin()
+    return _generic_plugin
 
 
 def iter_content(
@@ -7,9 +7,10 @@
 These helper/utility functions should **not** be exposed to plugins.
 """
 
-import functools
+import errno
+import os
 from pathlib import Path
-from typing import Callable, TypeVar
+from typing import Iterable
 
 from .config import instance as config
 from .log import instance as log
@@ -21,33 +22,30 @@ REQUIRED_DIRECTORIES = (
     config.temp_dir,
 )
 
-
-_T = TypeVar("_T")
+FALLOCATE_UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        errno.EINVAL,
+        errno.ENOSYS,
+    )
+    if code is not None
+)
 
 
-def compose_functions(*functions: Callable[[_T], _T]) -> Callable[[_T], _T]:
-    """Compose many similar functions together.
+def create_required_directories(
+    required_dirpaths: Iterable[Path] = REQUIRED_DIRECTORIES,
+):
+    """Handle setting up the required directories on the local machine.
 
     Args:
-        functions (List[Callable[[_T], _T]]):
-            Many functions to compose together.
-
-    Returns:
-        Callable[[_T], _T]:
-            A new function that applies all provided functions in order.
+        required_dirpaths (Iterable[~pathlib.Path], optional):
+            The directories that should be created if they don't already exist.
+            Defaults to ``REQUIRED_DIRECTORIES``.
     """
 
-    return functools.reduce(
-        lambda func_1, func_2: lambda x: func_2(func_1(x)),
-        functions,
-        lambda x: x,
-    )
-
-
-def create_required_directories():
-    """Handle setting up the required directories on the local machine."""
-
-    for required_dirpath in REQUIRED_DIRECTORIES:
+    for required_dirpath in required_dirpaths:
         if not required_dirpath.is_dir():
             log.debug(f"Creating required directory at {required_dirpath}")
             required_dirpath.mkdir(mode=0o777, parents=True)
@@ -56,6 +54,13 @@ def create_required_directories():
 def allocate_storage(to_path: Path, size: int) -> Path:
     """Allocate a specific number of bytes to a non-existing filepath.
 
+    Where ``posix_fallocate`` is available the disk blocks are reserved up front so
+    running out of space is reported here rather than halfway through a download.
+    Note that on filesystems without native support glibc emulates
+    ``posix_fallocate`` by writing every block, so allocation is ``O(size)`` rather
+    than the constant time of a sparse allocation. If the filesystem does not
+    support ``posix_fallocate`` at all, a sparse file is allocated instead.
+
     Args:
         to_path (~pathlib.Path):
             The filepath to allocate a specific number of bytes to.
@@ -63,8 +68,12 @@ def allocate_storage(to_path: Path, size: int) -> Path:
             The number of bytes to allocate.
 
     Raises:
+        ValueError:
+            If the given size is not greater than 0
         FileExistsError:
             If the given filepath already exists
+        OSError:
+            If the storage could not be allocated (such as ``ENOSPC``)
 
     Returns:
         ~pathlib.Path: The given filepath
@@ -81,8 +90,26 @@ def allocate_storage(to_path: Path, size: int) -> Path:
         to_path.parent.mkdir(mode=0o777, parents=True)
 
     log.debug(f"Allocating {size!s} bytes at {to_path!s}")
-    with to_path.open("wb") as file_handle:
-        file_handle.seek(size - 1)
-        file_handle.write(b"\x00")
+    with to_path.open("xb") as file_handle:
+        # only clean up once we know this call is the one that created the file
+        try:
+            if hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(file_handle.fileno(), 0, size)
+                    return to_path
+                except OSError as exc:
+                    if exc.errno not in FALLOCATE_UNSUPPORTED_ERRNOS:
+                        raise
+
+                    log.debug(
+                        f"Filesystem does not support fallocate for {to_path!s} "
+                        f"({exc!s}), falling back to a sparse allocation"
+                    )
+
+            file_handle.truncate(size)
+        except OSError:
+            # don't leave a partially allocated file behind to block a later retry
+            to_path.unlink(missing_ok=True)
+            raise
 
     return to_path
@@ -7,18 +7,22 @@
 import os
 import sys
 
-from hypothesis import HealthCheck, settings
+from hypothesis import HealthCheck, Phase, settings
 
 settings.register_profile(
     "default",
     suppress_health_check=[HealthCheck.too_slow],
     max_examples=10,
+    deadline=None,
 )
+# NOTE: failures are reported without shrinking in CI, the example database keeps them
+# around so they can be shrunk locally
 settings.register_profile(
     "ci",
     suppress_health_check=[HealthCheck.too_slow],
     max_examples=30,
     deadline=None,
+    phases=(Phase.explicit, Phase.reuse, Phase.generate, Phase.target),
 )
 settings.register_profile(
     "windows",
@@ -26,6 +30,24 @@ settings.register_profile(
     max_examples=10,
     deadline=None,
 )
+# NOTE: used for pull requests in CI so that every run draws the same examples
+# (derandomized runs never use the example database, the CI cached database is only
+# replayed for the randomized ci profile)
+settings.register_profile(
+    "pr",
+    suppress_health_check=[HealthCheck.too_slow],
+    max_examples=25,
+    deadline=None,
+    derandomize=True,
+)
+# NOTE: never loaded automatically, request it with HYPOTHESIS_PROFILE=nightly for a
+# thorough (and slow) scheduled run
+settings.register_profile(
+    "nightly",
+    suppress_health_check=[HealthCheck.too_slow],
+    max_examples=1000,
+    deadline=None,
+)
 
 settings.load_profile("default")
 
@@ -35,3 +57,7 @@ if sys.platform in ("win32",):
 # NOTE: this is currently tailored for Github actions
 if os.environ.get("CI", None) == "true":
     settings.load_profile("ci")
+
+# explicitly requested profiles always take precedence over the detected ones
+if os.environ.get("HYPOTHESIS_PROFILE"):
+    settings.load_profile(os.environ["HYPOTHESIS_PROFILE"])
@@ -5,15 +5,15 @@
 """Contains tests for the Http downloader."""
 
 import platform
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterator, Optional
+from threading import Thread
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
 from unittest.mock import MagicMock, call, patch
 
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis.strategies import (
-    binary,
     booleans,
     builds,
     dictionaries,
@@ -27,9 +27,13 @@ from hypothesis.strategies import (
 )
 from requests import PreparedRequest, Response, Session
 
-from megu.download.http import CONTENT_RANGE_PATTERN, HttpDownloader
+from megu.download.http import (
+    CONTENT_RANGE_PATTERN,
+    DEFAULT_MAX_CONNECTIONS,
+    HttpDownloader,
+)
 from megu.models.content import Content
-from megu.models.http import HttpResource
+from megu.models.http import HttpMethod, HttpResource
 
 from ..strategies import (
     megu_content,
@@ -39,12 +43,80 @@ from ..strategies import (
 )
 
 
+class _SessionStub:
+    """Lightweight stand-in for a requests session that records its calls."""
+
+    def __init__(self, response: Optional[Response] = None):
+        self.response = response
+        self.calls: List[Tuple[str, tuple, Dict[str, Any]]] = []
+
+    def send(self, *args, **kwargs) -> Optional[Response]:
+        self.calls.append(("send", args, kwargs))
+        return self.response
+
+    def head(self, *args, **kwargs) -> Optional[Response]:
+        self.calls.append(("head", args, kwargs))
+        return self.response
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler that responds to every GET with a tiny body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def local_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port!s}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="module")
+def scratch_path(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("download").joinpath("scratch")
+
+
 def test_session():
     downloader = HttpDownloader()
     session = downloader.session
     assert isinstance(session, Session)
     assert downloader.session is session
 
+    # the pool must be able to hold a connection for each concurrent download worker
+    adapter = session.get_adapter("https://")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] >= max(
+        10, DEFAULT_MAX_CONNECTIONS
+    )
+
+
+def test_request_resource_reuses_connection(local_url: str):
+    downloader = HttpDownloader()
+    resource = HttpResource(method=HttpMethod.GET, url=local_url)
+
+    for _ in range(2):
+        response = downloader._request_resource(resource)
+        assert response.content == b"ok"
+        response.close()
+
+    pools = downloader.session.get_adapter(local_url).poolmanager.pools
+    assert len(pools) == 1
+    (pool_key,) = pools.keys()
+    assert pools[pool_key].num_connections == 1
+
 
 @given(
     megu_content(resources_strategy=lists(megu_http_resource(), min_size=1, max_size=3))
@@ -56,21 +128,17 @@ def test_can_handle(content: Content):
 @given(megu_http_resource(), booleans())
 def test_request_resource(resource: HttpResource, stream: bool):
     downloader = HttpDownloader()
+    downloader.session = _SessionStub()  # type: ignore
 
-    with patch.object(downloader, "session") as mocked_session:
-        downloader._request_resource(resource, stream=stream)
-        send_call = mocked_session.send.call_args
+    downloader._request_resource(resource, stream=stream)
+    ((method, args, kwargs),) = downloader.session.calls  # type: ignore
 
-        assert isinstance(send_call.args[0], PreparedRequest)
-        assert send_call.kwargs["stream"] == stream
+    assert method == "send"
+    assert isinstance(args[0], PreparedRequest)
+    assert kwargs["stream"] == stream
 
 
-@given(
-    integers(min_value=0, max_value=1024),
-    integers(min_value=1024, max_value=2048),
-    integers(min_value=2048, max_value=4096),
-)
-def test_iter_range(start: int, end: int, size: int):
+def _check_iter_range(start: int, end: int, size: int):
     downloader = HttpDownloader()
 
     iterator = downloader._iter_ranges(start, end, size=size)
@@ -89,6 +157,32 @@ def test_iter_range(start: int, end: int, size: int):
     assert last_end == size
 
 
+@pytest.mark.parametrize(
+    "start,end,size",
+    [
+        (0, 0, 0),
+        (0, 1, 1),
+        (0, 0, 16),
+        (0, 1024, 1024),
+        (0, 1024, 2048),
+        (1023, 1024, 4096),
+        (0, 4096, 2 ** 20),
+    ],
+)
+def test_iter_range_boundaries(start: int, end: int, size: int):
+    _check_iter_range(start, end, size)
+
+
+@settings(max_examples=15)
+@given(
+    integers(min_value=0, max_value=1024),
+    integers(min_value=1024, max_value=2048),
+    integers(min_value=2048, max_value=4096),
+)
+def test_iter_range(start: int, end: int, size: int):
+    _check_iter_range(start, end, size)
+
+
 @given(
     integers(min_value=0, max_value=1024),
     integers(min_value=1025, max_value=2048),
@@ -117,22 +211,23 @@ def test_iter_range_raises_StopIteration(start: int, end: int, size: int):
             ),
             builds(dict),
         ),
-        raw_strategy=binary(min_size=1024, max_size=2048),
+        raw_strategy=sampled_from([b"\x00" * 1024, b"\xff" * 1536, b"abcd" * 512]),
     ),
     integers(min_value=1, max_value=256),
     one_of(builds(MagicMock), none()),
 )
 def test_download_normal(
+    scratch_path: Path,
     resource: HttpResource,
     response: Response,
     chunk_size: int,
     update_hook: Optional[MagicMock],
 ):
+    scratch_path.write_bytes(b"")
+
     downloader = HttpDownloader()
-    with patch(
-        "megu.download.http.allocate_storage"
-    ) as mock_allocate_storage, NamedTemporaryFile() as temp_file:
-        to_path = Path(temp_file.name)
+    with patch("megu.download.http.allocate_storage") as mock_allocate_storage:
+        to_path = scratch_path
         result = downloader._download_normal(
             resource,
             response,
@@ -152,8 +247,7 @@ def test_download_normal(
         assert result == to_path
 
         # check downloaded content from stream is expected
-        temp_file.seek(0)
-        assert temp_file.read() == response.content
+        assert to_path.read_bytes() == response.content
 
 
 @pytest.mark.skipif(
@@ -169,7 +263,7 @@ def test_download_normal(
             min_size=1,
             max_size=1,
         ),
-        raw_strategy=binary(min_size=256, max_size=256),
+        raw_strategy=sampled_from([b"\x00" * 256, b"\xff" * 256, b"abcd" * 64]),
     ),
     requests_response(
         headers_strategy=dictionaries(
@@ -178,26 +272,29 @@ def test_download_normal(
             min_size=1,
             max_size=1,
         ),
-        raw_strategy=binary(min_size=255, max_size=255),
+        raw_strategy=sampled_from([b"\x00" * 255, b"\xff" * 255, b"abc" * 85]),
     ),
     integers(min_value=1, max_value=256),
     one_of(builds(MagicMock), none()),
 )
 def test_download_partial(
+    scratch_path: Path,
     resource: HttpResource,
     response: Response,
     second_response: Response,
     chunk_size: int,
     update_hook: Optional[MagicMock],
 ):
+    scratch_path.write_bytes(b"")
+
     downloader = HttpDownloader()
     with patch(
         "megu.download.http.allocate_storage"
     ) as mock_allocate_storage, patch.object(
         downloader, "_request_resource"
-    ) as mock_request_resource, NamedTemporaryFile() as temp_file:
+    ) as mock_request_resource:
         mock_request_resource.return_value = second_response
-        to_path = Path(temp_file.name)
+        to_path = scratch_path
         result = downloader._download_partial(
             resource, response, to_path, chunk_size=chunk_size, update_hook=update_hook
         )
@@ -210,8 +307,7 @@ def test_download_partial(
         assert result == to_path
 
         # check downloaded content from stream is expected
-        temp_file.seek(0)
-        assert temp_file.read() == response.content + second_response.content
+        assert to_path.read_bytes() == response.content + second_response.content
 
 
 @given(
@@ -328,8 +424,8 @@ def test_download_resource_raises_ValueError(
 )
 def test_get_content_size(content: Content, response: Response):
     downloader = HttpDownloader()
-    with patch.object(downloader.session, "head") as mock_session_head:
-        mock_session_head.return_value = response
-        content_size = downloader._get_content_size(content)
+    downloader.session = _SessionStub(response)  # type: ignore
 
-        assert content_size > 0
+    content_size = downloader._get_content_size(content)
+    assert content_size > 0
+    assert len(downloader.session.calls) == len(content.resources)  # type: ignore
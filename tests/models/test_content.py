@@ -5,26 +5,71 @@
 """Contains tests for content model classes and types."""
 
 import mimetypes
+from typing import Optional
 
+import pytest
 from hypothesis import given
 from hypothesis.strategies import from_regex, none
 
 from megu.models.content import Content
+from megu.models.http import HttpResource
 
 from ..strategies import megu_content
 
 
+def _build_content(id: str, type: str, extension: Optional[str] = None) -> Content:
+    """Build a minimal content instance for testing name related properties."""
+
+    return Content(
+        id=id,
+        name=id,
+        url="https://example.com",
+        quality=1.0,
+        size=1,
+        type=type,
+        extension=extension,
+        resources=[HttpResource(method="GET", url="https://example.com")],
+    )
+
+
 @given(megu_content(extension_strategy=from_regex(r"^\..+$")))
 def test_Content_ext_as_provided(content: Content):
     assert content.ext == content.extension
 
 
+@pytest.mark.parametrize(
+    "type,ext",
+    [
+        ("video/mp4", ".mp4"),
+        ("image/png", ".png"),
+        ("audio/mpeg", ".mp3"),
+        ("application/json", ".json"),
+        ("application/x-megu-unknown", ""),
+    ],
+)
+def test_Content_ext_via_type(type: str, ext: str):
+    assert _build_content("test", type).ext == ext
+
+
 @given(megu_content(extension_strategy=none()))
 def test_Content_ext_from_mimetype(content: Content):
     ext = mimetypes.guess_extension(content.type)
     assert content.ext == (ext if ext is not None else "")
 
 
+@pytest.mark.parametrize(
+    "id,type,extension,filename",
+    [
+        ("test", "video/mp4", None, "test.mp4"),
+        ("test", "image/png", ".jpeg", "test.jpeg"),
+        ("test-1", "application/x-megu-unknown", None, "test-1"),
+        ("a.b", "text/plain", ".txt", "a.b.txt"),
+    ],
+)
+def test_Content_filename(id: str, type: str, extension: Optional[str], filename: str):
+    assert _build_content(id, type, extension).filename == filename
+
+
 @given(megu_content())
-def test_Content_filename(content: Content):
+def test_Content_filename_smoke(content: Content):
     assert content.filename == f"{content.id!s}{content.ext!s}"
@@ -13,6 +13,17 @@ from megu.models.http import HttpMethod, HttpResource
 
 from ..strategies import megu_http_resource, requests_request
 
+# only the method, URL, and headers are under test, so skip the body, cookie, auth,
+# and hook handling of a full PreparedRequest.prepare() call
+_PREPARED_REQUEST = PreparedRequest()
+
+
+def _prepared_from(request: Request) -> PreparedRequest:
+    _PREPARED_REQUEST.prepare_method(request.method)
+    _PREPARED_REQUEST.prepare_url(request.url, request.params)
+    _PREPARED_REQUEST.prepare_headers(request.headers)
+    return _PREPARED_REQUEST
+
 
 @given(megu_http_resource())
 def test_HttpResource_get_signature(resource: HttpResource):
@@ -24,13 +35,24 @@ def test_HttpResource_get_signature(resource: HttpResource):
 @given(megu_http_resource())
 def test_HttpResource_fingerprint(resource: HttpResource):
     assert isinstance(resource.fingerprint, str)
-    assert len(resource.fingerprint) > 0
+    assert len(resource.fingerprint) == 32
+    assert int(resource.fingerprint, 16) >= 0
+
+
+def test_HttpResource_fingerprint_is_stable():
+    resource = HttpResource(
+        method=HttpMethod.POST,
+        url="https://example.com/media.mp4",
+        headers={"Range": "bytes=0-1023"},
+        data=b"megu",
+    )
+    assert resource.fingerprint == "8ae679cbf155c2ee003692a85a0df4f9"
 
 
 @pytest.mark.skip(reason="Requests and Pydantic have different interpretations of URLs")
 @given(requests_request())
 def test_HttpResource_from_request(request: Request):
-    prepared_request = request.prepare()
+    prepared_request = _prepared_from(request)
     resource = HttpResource.from_request(prepared_request)
     assert isinstance(resource, HttpResource)
     assert str(resource.url).lower() == prepared_request.url.lower()  # type: ignore
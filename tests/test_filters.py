@@ -4,32 +4,84 @@
 
 """Contains tests for content filters."""
 
+from itertools import zip_longest
 from typing import List
+from unittest.mock import patch
 
-import pytest
 from hypothesis import given
-from hypothesis.strategies import just, lists
+from hypothesis.strategies import just, lists, sampled_from
 
-from megu.filters import best_content
+from megu.filters import best_content, specific_content
 from megu.models import Content
 
 from .strategies import megu_content
 
+_A_CONTENT_STRATEGY = megu_content(id_strategy=just("a"))
+_B_CONTENT_STRATEGY = megu_content(id_strategy=just("b"))
+
 
 @given(
     lists(
-        megu_content(id_strategy=just("a")),
+        _A_CONTENT_STRATEGY,
         max_size=3,
         min_size=1,
         unique_by=lambda c: c.quality,
     ),
 )
 def test_best_content_filter(content_list: List[Content]):
-    content_iterator = iter(content_list)
-    content = next(best_content(content_iterator))  # type: ignore
+    best_iterator = iter(best_content(iter(content_list)))
+    content = next(best_iterator)
     assert isinstance(content, Content)
 
-    with pytest.raises(StopIteration):
-        next(best_content(content_iterator))  # type: ignore
+    # content sharing a single id should only ever produce one best content
+    assert next(best_iterator, None) is None
+    assert max(c.quality for c in content_list) == content.quality
+
+
+@given(
+    lists(_A_CONTENT_STRATEGY, min_size=1, max_size=3),
+    lists(_B_CONTENT_STRATEGY, min_size=1, max_size=3),
+)
+def test_best_content_yields_content_from_multiple_ids(
+    a_content_list: List[Content], b_content_list: List[Content]
+):
+    # interleave the content so that content with the same id is not adjacent
+    content_list = [
+        content
+        for pair in zip_longest(a_content_list, b_content_list)
+        for content in pair
+        if content is not None
+    ]
+
+    best = list(best_content(content_list))
+    assert [content.id for content in best] == ["a", "b"]
+    assert best[0].quality == max(c.quality for c in a_content_list)
+    assert best[1].quality == max(c.quality for c in b_content_list)
+
+
+@given(
+    lists(
+        megu_content(
+            quality_strategy=sampled_from([1.0, 2.0]),
+            type_strategy=sampled_from(["video/mp4", "image/png"]),
+        ),
+        max_size=5,
+    )
+)
+def test_specific_content(content_list: List[Content]):
+    assert list(specific_content(content_list)) == content_list
+    assert list(specific_content(content_list, quality=1.0)) == [
+        content for content in content_list if content.quality == 1.0
+    ]
+    assert list(specific_content(content_list, quality=2.0, type="image/png")) == [
+        content
+        for content in content_list
+        if content.quality == 2.0 and content.type == "image/png"
+    ]
+
 
-    assert max([c.quality for c in content_list]) == content.quality
+@given(lists(megu_content(), max_size=3))
+def test_specific_content_warns_for_unknown_filters(content_list: List[Content]):
+    with patch("megu.filters.log") as mocked_log:
+        assert list(specific_content(content_list, unknown=1)) == content_list
+        mocked_log.warning.assert_called_once()
@@ -4,25 +4,73 @@
 
 """Contains unit-tests for package hasher functions."""
 
+import hashlib
+import mmap
 import os
+from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
 from tempfile import mkstemp
-from typing import Set
+from typing import Generator, Set
+from unittest.mock import patch
 
 import pytest
 from hypothesis import given
 from hypothesis.strategies import binary, integers, sets
 
-from megu.hasher import DEFAULT_CHUNK_SIZE, HashType, hash_file, hash_io
+from megu import hasher
+from megu.hasher import DEFAULT_CHUNK_SIZE, HashType, hash_bytes, hash_file, hash_io
 
-from .strategies import HashType_strategy, pathlib_path
+from .strategies import HashType_strategy, missing_path
+
+
+@contextmanager
+def _temporary_content_file(content: bytes) -> Generator[Path, None, None]:
+    """Write some content to a temporary file that is removed on exit."""
+
+    (temp_fd, temp_name) = mkstemp()
+    try:
+        os.write(temp_fd, content)
+    finally:
+        os.close(temp_fd)
+
+    try:
+        yield Path(temp_name)
+    finally:
+        try:
+            os.remove(temp_name)
+        except PermissionError:
+            # NOTE: typically occurs on windows when running tests in parallel, but
+            # since we are creating these in a temporary directory it shouldn't really
+            # matter if we can fully remove the link to this file
+            pass
+
+
+_HASH_TYPES_STRATEGY = sets(HashType_strategy)
+_MULTIPLE_HASH_TYPES_STRATEGY = sets(HashType_strategy, min_size=2)
+_CHUNK_SIZE_STRATEGY = integers(min_value=1, max_value=DEFAULT_CHUNK_SIZE)
+
+
+@given(binary(), _HASH_TYPES_STRATEGY)
+def test_hash_bytes(content: bytes, hash_types: Set[HashType]):
+    """Ensure hash_bytes works properly."""
+
+    results = hash_bytes(content, hash_types)
+    assert isinstance(results, dict)
+    assert len(results) == len(hash_types)
+
+    for hash_type, hash_result in results.items():
+        assert isinstance(hash_type, HashType)
+        assert isinstance(hash_result, str)
+
+        assert hash_type.hasher(content).hexdigest() == hash_result
+        assert hash_io(BytesIO(content), {hash_type})[hash_type] == hash_result
 
 
 @given(
     binary(),
-    sets(HashType_strategy),
-    integers(min_value=1, max_value=DEFAULT_CHUNK_SIZE),
+    _HASH_TYPES_STRATEGY,
+    _CHUNK_SIZE_STRATEGY,
 )
 def test_hash_io(content: bytes, hash_types: Set[HashType], chunk_size: int):
     """Ensure hash_io works properly."""
@@ -39,45 +87,144 @@ def test_hash_io(content: bytes, hash_types: Set[HashType], chunk_size: int):
         assert hash_type.hasher(content).hexdigest() == hash_result
 
 
+@given(
+    binary(max_size=64),
+    integers(min_value=1, max_value=16),
+    integers(min_value=1, max_value=16),
+)
+def test_sha256_tree_hashes_segments(
+    content: bytes, segment_size: int, chunk_size: int
+):
+    """Ensure the sha256 tree hash is the sha256 of the segment sha256 digests."""
+
+    segments = [
+        content[offset : offset + segment_size]
+        for offset in range(0, len(content), segment_size)
+    ] or [b""]
+    expected = hashlib.sha256(
+        b"".join(hashlib.sha256(segment).digest() for segment in segments)
+    ).hexdigest()
+
+    with patch("megu.hasher.TREE_SEGMENT_SIZE", segment_size), patch(
+        "megu.hasher._CPU_COUNT", 4
+    ):
+        assert hash_bytes(content, {HashType.SHA256_TREE}) == {
+            HashType.SHA256_TREE: expected
+        }
+        assert hash_io(BytesIO(content), {HashType.SHA256_TREE}, chunk_size) == {
+            HashType.SHA256_TREE: expected
+        }
+
+
+class _ReadOnlyIO:
+    """Binary IO stub that only supports read (no readinto)."""
+
+    def __init__(self, content: bytes):
+        self._io = BytesIO(content)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._io.read(size)
+
+
 @given(
     binary(),
-    sets(HashType_strategy),
-    integers(min_value=1, max_value=DEFAULT_CHUNK_SIZE),
+    _HASH_TYPES_STRATEGY,
+    _CHUNK_SIZE_STRATEGY,
+)
+def test_hash_io_without_readinto(
+    content: bytes, hash_types: Set[HashType], chunk_size: int
+):
+    """Ensure hash_io works properly for IO that only supports read."""
+
+    results = hash_io(
+        io=_ReadOnlyIO(content), types=hash_types, chunk_size=chunk_size  # type: ignore
+    )
+    assert len(results) == len(hash_types)
+    for hash_type, hash_result in results.items():
+        assert hash_type.hasher(content).hexdigest() == hash_result
+
+
+@given(
+    binary(min_size=1),
+    _MULTIPLE_HASH_TYPES_STRATEGY,
+    _CHUNK_SIZE_STRATEGY,
+)
+def test_hash_io_updates_hashers_concurrently(
+    content: bytes, hash_types: Set[HashType], chunk_size: int
+):
+    """Ensure hash_io works properly when updating hashers from threads."""
+
+    with patch("megu.hasher._CPU_COUNT", 4), patch(
+        "megu.hasher.PARALLEL_THRESHOLD", 1
+    ), patch.object(
+        hasher._hasher_executor, "submit", wraps=hasher._hasher_executor.submit
+    ) as mocked_submit:
+        results = hash_io(io=BytesIO(content), types=hash_types, chunk_size=chunk_size)
+        assert mocked_submit.call_count >= len(hash_types)
+
+    assert len(results) == len(hash_types)
+    for hash_type, hash_result in results.items():
+        assert hash_type.hasher(content).hexdigest() == hash_result
+
+
+@given(
+    binary(),
+    _HASH_TYPES_STRATEGY,
+    _CHUNK_SIZE_STRATEGY,
 )
 def test_hash_file(content: bytes, hash_types: Set[HashType], chunk_size: int):
     """Ensure hash_file works properly."""
 
-    (_, temp_name) = mkstemp()
-    with open(temp_name, "wb") as file_io:
-        file_io.write(content)
-
-    try:
-        temp_filepath = Path(temp_name).resolve()
+    with _temporary_content_file(content) as temp_filepath:
         results = hash_file(
             filepath=temp_filepath, types=hash_types, chunk_size=chunk_size
         )
-        assert isinstance(results, dict)
-        assert len(results) == len(hash_types)
 
-        for hash_type, hash_result in results.items():
-            assert isinstance(hash_type, HashType)
-            assert isinstance(hash_result, str)
+    assert isinstance(results, dict)
+    assert len(results) == len(hash_types)
 
-            assert hash_type.hasher(content).hexdigest() == hash_result
-    finally:
-        try:
-            os.remove(temp_name)
-        except PermissionError:
-            # NOTE: typically occurs on windows when running tests in parallel, but
-            # since we are creating these in a temporary directory it shouldn't really
-            # matter if we can fully remove the link to this file
-            pass
+    for hash_type, hash_result in results.items():
+        assert isinstance(hash_type, HashType)
+        assert isinstance(hash_result, str)
+
+        assert hash_type.hasher(content).hexdigest() == hash_result
+
+
+@given(binary(min_size=2), _HASH_TYPES_STRATEGY)
+def test_hash_file_memory_maps_large_files(content: bytes, hash_types: Set[HashType]):
+    """Ensure hash_file works properly when memory-mapping files."""
+
+    with _temporary_content_file(content) as temp_filepath, patch(
+        "megu.hasher.MMAP_THRESHOLD", 1
+    ), patch("megu.hasher.mmap.mmap", wraps=mmap.mmap) as mocked_mmap:
+        results = hash_file(filepath=temp_filepath, types=hash_types, chunk_size=1)
+        mocked_mmap.assert_called_once()
+
+    assert len(results) == len(hash_types)
+    for hash_type, hash_result in results.items():
+        assert hash_type.hasher(content).hexdigest() == hash_result
+
+
+@given(binary(min_size=2), _HASH_TYPES_STRATEGY)
+def test_hash_file_falls_back_when_memory_mapping_fails(
+    content: bytes, hash_types: Set[HashType]
+):
+    """Ensure hash_file falls back to chunked reads if a file cannot be mapped."""
+
+    with _temporary_content_file(content) as temp_filepath, patch(
+        "megu.hasher.MMAP_THRESHOLD", 1
+    ), patch("megu.hasher.mmap.mmap", side_effect=OSError):
+        results = hash_file(filepath=temp_filepath, types=hash_types, chunk_size=1)
+
+    assert len(results) == len(hash_types)
+    for hash_type, hash_result in results.items():
+        assert hash_type.hasher(content).hexdigest() == hash_result
 
 
 @given(
-    pathlib_path(),
-    sets(HashType_strategy),
-    integers(min_value=1, max_value=DEFAULT_CHUNK_SIZE),
+    missing_path(),
+    _HASH_TYPES_STRATEGY,
+    _CHUNK_SIZE_STRATEGY,
 )
 def test_hash_file_raises_FileNotFoundError_with_missing_file(
     filepath: Path, hash_types: Set[HashType], chunk_size: int
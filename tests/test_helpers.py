@@ -4,6 +4,7 @@
 
 """Contains tests for package helpers."""
 
+import shutil
 import string
 import sys
 import tempfile
@@ -12,7 +13,7 @@ from typing import Any, Dict, List
 from unittest.mock import patch
 
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
 from diskcache import Cache
 from hypothesis import given
 from hypothesis.strategies import dictionaries, from_regex, lists, sampled_from, text
@@ -21,6 +22,7 @@ from requests import Session
 from megu.constants import TEMP_DIR
 from megu.helpers import (
     DISK_CACHE_PATTERN,
+    SOUP_MEDIA_STRAINER,
     disk_cache,
     get_soup,
     http_session,
@@ -31,12 +33,19 @@ from megu.helpers import (
     temporary_file,
 )
 
-from .strategies import builtin_types, pathlib_path, pythonic_name
+from .strategies import builtin_types, missing_path, pythonic_name
+
+_ARGS_STRATEGY = lists(builtin_types(), max_size=4)
+_KWARGS_STRATEGY = dictionaries(
+    keys=pythonic_name(), values=builtin_types(), max_size=4
+)
+_CACHE_NAME_STRATEGY = from_regex(DISK_CACHE_PATTERN, fullmatch=True)
+_FILE_MODE_STRATEGY = sampled_from(["w", "wb"])
 
 
 @given(
-    lists(builtin_types(), max_size=4),
-    dictionaries(keys=pythonic_name(), values=builtin_types(), max_size=4),
+    _ARGS_STRATEGY,
+    _KWARGS_STRATEGY,
     pythonic_name(),
 )
 def test_noop_class(args: List[Any], kwargs: Dict[str, Any], random_attribute: str):
@@ -48,8 +57,8 @@ def test_noop_class(args: List[Any], kwargs: Dict[str, Any], random_attribute: s
 
 
 @given(
-    lists(builtin_types(), max_size=4),
-    dictionaries(keys=pythonic_name(), values=builtin_types(), max_size=4),
+    _ARGS_STRATEGY,
+    _KWARGS_STRATEGY,
 )
 def test_noop(args: List[Any], kwargs: Dict[str, Any]):
     assert noop(*args, **kwargs) is None  # type: ignore
@@ -60,6 +69,13 @@ def test_http_session():
         assert isinstance(session, Session)
 
 
+def test_http_session_shares_connection_pool():
+    with http_session() as first_session, http_session() as second_session:
+        assert first_session is not second_session
+        for url in ("https://example.com", "http://example.com"):
+            assert first_session.get_adapter(url) is second_session.get_adapter(url)
+
+
 @given(
     text(string.printable).filter(
         lambda name: DISK_CACHE_PATTERN.match(name) is None,
@@ -71,34 +87,41 @@ def test_disk_cache_raises_ValueError(cache_name: str):
             ...
 
 
-@given(from_regex(DISK_CACHE_PATTERN, fullmatch=True))
-def test_disk_cache(cache_name: str):
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dirpath = Path(temp_dir)
-        with patch("megu.helpers.config.cache_dir", temp_dirpath):
-            diskcache_dirpath = temp_dirpath.joinpath(cache_name)
-            assert diskcache_dirpath.is_dir() == False
-            diskcache_dirpath.mkdir(parents=True)
+@pytest.fixture(scope="module")
+def cache_dirpath(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("disk_cache")
+
 
+@given(_CACHE_NAME_STRATEGY)
+def test_disk_cache(cache_dirpath: Path, cache_name: str):
+    with patch("megu.helpers.config.cache_dir", cache_dirpath):
+        diskcache_dirpath = cache_dirpath.joinpath(cache_name)
+        assert diskcache_dirpath.is_dir() == False
+        diskcache_dirpath.mkdir(parents=True)
+
+        try:
             with disk_cache(cache_name) as cache:
                 assert diskcache_dirpath.is_dir() == True
                 assert isinstance(cache, Cache)
+        finally:
+            shutil.rmtree(diskcache_dirpath, ignore_errors=True)
 
 
-@given(from_regex(DISK_CACHE_PATTERN, fullmatch=True))
-def test_disk_cache_creates_directory(cache_name: str):
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dirpath = Path(temp_dir)
-        with patch("megu.helpers.config.cache_dir", temp_dirpath):
-            diskcache_dirpath = temp_dirpath.joinpath(cache_name)
-            assert diskcache_dirpath.is_dir() == False
+@given(_CACHE_NAME_STRATEGY)
+def test_disk_cache_creates_directory(cache_dirpath: Path, cache_name: str):
+    with patch("megu.helpers.config.cache_dir", cache_dirpath):
+        diskcache_dirpath = cache_dirpath.joinpath(cache_name)
+        assert diskcache_dirpath.is_dir() == False
 
+        try:
             with disk_cache(cache_name) as cache:
                 assert diskcache_dirpath.is_dir() == True
                 assert isinstance(cache, Cache)
+        finally:
+            shutil.rmtree(diskcache_dirpath, ignore_errors=True)
 
 
-@given(pythonic_name(), sampled_from(["w", "wb"]), pathlib_path())
+@given(pythonic_name(), _FILE_MODE_STRATEGY, missing_path())
 def test_temporary_file_raises_NotADirectoryError(
     prefix: str, mode: str, dirpath: Path
 ):
@@ -107,7 +130,7 @@ def test_temporary_file_raises_NotADirectoryError(
             ...
 
 
-@given(pythonic_name(), sampled_from(["w", "wb"]))
+@given(pythonic_name(), _FILE_MODE_STRATEGY)
 def test_temporary_file(prefix: str, mode: str):
     if not TEMP_DIR.is_dir():
         TEMP_DIR.mkdir()
@@ -121,7 +144,7 @@ def test_temporary_file(prefix: str, mode: str):
     assert temp_filepath.is_file() == False
 
 
-@given(pythonic_name(), pathlib_path())
+@given(pythonic_name(), missing_path())
 def test_temporary_directory_raises_NotADirectoryError(prefix: str, dirpath: Path):
     with pytest.raises(NotADirectoryError):
         with temporary_directory(prefix, dirpath):
@@ -146,14 +169,45 @@ def test_python_path_skips_inserts_if_none_provided():
         assert paths == starting_paths
 
 
-@given(pathlib_path())
+@given(missing_path())
 def test_python_path_inserts_provided_directories(random_path: Path):
     starting_paths = sys.path.copy()
     with python_path(Path(".."), Path("~"), random_path) as paths:
         assert len(paths) - len(starting_paths) == 2
 
 
+def test_python_path_restores_original_paths(tmp_path: Path):
+    starting_paths = sys.path.copy()
+    original_path_list = sys.path
+
+    with python_path(tmp_path) as paths:
+        assert paths[0] == tmp_path.resolve().as_posix()
+
+    assert sys.path is original_path_list
+    assert sys.path == starting_paths
+
+
 @given(text(string.ascii_letters + string.digits))
 def test_get_soup(dom: str):
     soup = get_soup(dom)
     assert isinstance(soup, BeautifulSoup)
+
+
+@pytest.mark.parametrize("tags", ["a", ["a", "video"], SOUP_MEDIA_STRAINER])
+def test_get_soup_parses_only_tags(tags: Any):
+    soup = get_soup(
+        "<html><body><p>text</p><a href='#'>link</a><video></video></body></html>", tags
+    )
+    assert isinstance(soup, BeautifulSoup)
+    assert soup.find("p") is None
+    assert soup.find("a") is not None
+
+
+def test_get_soup_falls_back_to_html_parser():
+    with patch(
+        "megu.helpers.BeautifulSoup",
+        side_effect=[FeatureNotFound, BeautifulSoup("", features="html.parser")],
+    ) as mocked_soup:
+        assert isinstance(get_soup(""), BeautifulSoup)
+
+    assert mocked_soup.call_args_list[-1].kwargs["features"] == "html.parser"
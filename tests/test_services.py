@@ -4,19 +4,137 @@
 
 """Contains tests for package services."""
 
-from typing import Union
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator, Set
+from unittest.mock import Mock
 
+import pytest
 from hypothesis import given
-from hypothesis.provisional import urls
-from hypothesis.strategies import one_of
 
-from megu.models.content import Url
-from megu.services import normalize_url
+from megu import services
+from megu.download.http import HttpDownloader
+from megu.models.content import Content, Url
+from megu.plugin.generic import GenericPlugin
+from megu.services import get_downloader, get_plugin, normalize_url
 
-from .strategies import megu_url
+from .strategies import FULL_URL_STRATEGY, megu_content, megu_url
 
 
-@given(one_of(urls().filter(lambda u: ":0/" not in u), megu_url()))
-def test_normalize_url(url: Union[Url, str]):
+@contextmanager
+def _swapped(target: Any, name: str, value: Any) -> Generator[None, None, None]:
+    """Swap an attribute directly, avoiding mock.patch overhead for every example."""
+
+    original = getattr(target, name)
+    setattr(target, name, value)
+    try:
+        yield
+    finally:
+        setattr(target, name, original)
+
+
+class _PluginStub:
+    """Minimal plugin stand-in exposing only what plugin lookup relies on."""
+
+    def __init__(self, domains: Set[str], handles: bool = True):
+        self.domains = domains
+        self.handles = handles
+
+    def can_handle(self, url: Url) -> bool:
+        return self.handles
+
+
+def _no_downloaders(*args, **kwargs) -> Iterator:
+    """Replacement for downloader discovery that finds no downloaders."""
+
+    return iter(())
+
+
+@contextmanager
+def _available_plugins(*plugins: _PluginStub) -> Generator[None, None, None]:
+    """Replace plugin discovery so that only the given plugins are available."""
+
+    services._get_available_plugins.cache_clear()
+    try:
+        with _swapped(
+            services,
+            "iter_available_plugins",
+            lambda *args, **kwargs: iter([("test", [*plugins])] if plugins else []),
+        ):
+            yield
+    finally:
+        services._get_available_plugins.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com",
+        "http://example.com/path?query=1",
+        "https://sub.example.com:8080/a/b/c.mp4#fragment",
+        "https://[::1]/",
+        "http://127.0.0.1/",
+        "https://example.com/%E2%9C%93?q=%20",
+        "file:///tmp/a",
+    ],
+)
+def test_normalize_url(url: str):
     normalized = normalize_url(url)
     assert isinstance(normalized, Url)
+
+
+@given(megu_url(url_strategy=FULL_URL_STRATEGY))
+def test_normalize_url_returns_Url_instances(url: Url):
+    assert normalize_url(url) is url
+
+
+@given(megu_url())
+def test_get_plugin(url: Url):
+    plugin = _PluginStub(domains={url.netloc})
+    with _available_plugins(plugin):
+        assert get_plugin(url) is plugin
+
+
+@given(megu_url())
+def test_get_plugin_ignores_urls_not_matching_supported_domains(url: Url):
+    plugin = _PluginStub(domains={""})
+    with _available_plugins(plugin):
+        assert isinstance(get_plugin(url), GenericPlugin)
+
+
+@given(megu_url())
+def test_get_plugin_ignores_plugins_that_cannot_handle_url(url: Url):
+    plugin = _PluginStub(domains={url.netloc}, handles=False)
+    with _available_plugins(plugin):
+        assert isinstance(get_plugin(url), GenericPlugin)
+
+
+@given(megu_url())
+def test_get_plugin_falls_back_to_GenericPlugin(url: Url):
+    with _available_plugins():
+        plugin = get_plugin(url)
+        assert isinstance(plugin, GenericPlugin)
+        assert get_plugin(url) is plugin
+
+
+@given(megu_url())
+def test_get_plugin_discovers_plugins_once(url: Url):
+    plugin = _PluginStub(domains={url.netloc})
+    with _available_plugins(plugin), _swapped(
+        services,
+        "iter_available_plugins",
+        Mock(wraps=services.iter_available_plugins),
+    ):
+        assert get_plugin(url) is plugin
+        assert get_plugin(url) is plugin
+        services.iter_available_plugins.assert_called_once()
+
+
+@given(megu_content())
+def test_get_downloader(content: Content):
+    assert isinstance(get_downloader(content), HttpDownloader)
+
+
+@given(megu_content())
+def test_get_downloader_falls_back_to_HttpDownloader(content: Content):
+    with _swapped(services, "discover_downloaders", _no_downloaders):
+        assert isinstance(get_downloader(content), HttpDownloader)
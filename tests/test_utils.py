@@ -4,9 +4,12 @@
 
 """Contains tests for package utilities."""
 
+import errno
+import os
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import List
+from typing import Generator, List
 from unittest.mock import patch
 
 import pytest
@@ -17,27 +20,51 @@ from megu.utils import allocate_storage, create_required_directories
 
 from .strategies import pathlib_path, pythonic_name
 
+_SIZE_STRATEGY = integers(min_value=1, max_value=1024)
 
-@given(lists(pythonic_name(), min_size=1, max_size=4))
-def test_create_required_directories(required_directory_names: List[str]):
-    with TemporaryDirectory() as temp_dir:
-        temp_dirpath = Path(temp_dir)
-        assert temp_dirpath.is_dir() == True
 
+@pytest.fixture(scope="module")
+def scratch_dirpath(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("utils")
+
+
+@pytest.fixture(scope="module")
+def existing_filepath(tmp_path_factory) -> Path:
+    filepath = tmp_path_factory.mktemp("utils-existing").joinpath("existing")
+    filepath.touch()
+    return filepath
+
+
+@contextmanager
+def _example_dirpath(scratch_dirpath: Path) -> Generator[Path, None, None]:
+    """Reuse a single directory for each example, clearing it once the example ends."""
+
+    example_dirpath = scratch_dirpath.joinpath("example")
+    example_dirpath.mkdir()
+    try:
+        yield example_dirpath
+    finally:
+        shutil.rmtree(example_dirpath, ignore_errors=True)
+
+
+@given(lists(pythonic_name(), min_size=1, max_size=4))
+def test_create_required_directories(
+    scratch_dirpath: Path, required_directory_names: List[str]
+):
+    with _example_dirpath(scratch_dirpath) as temp_dirpath:
         required_dirpaths = [
             temp_dirpath.joinpath(name) for name in required_directory_names
         ]
 
         assert all(path.is_dir() == False for path in required_dirpaths)
-        with patch("megu.utils.REQUIRED_DIRECTORIES", tuple(required_dirpaths)):
-            create_required_directories()
-            assert all(path.is_dir() == True for path in required_dirpaths)
+        create_required_directories(required_dirpaths)
+        assert all(path.is_dir() == True for path in required_dirpaths)
 
 
-@given(pythonic_name(), integers(min_value=1, max_value=1024))
-def test_allocate_storage(filename: str, size: int):
-    with TemporaryDirectory() as temp_dir:
-        to_path = Path(temp_dir).joinpath(filename)
+@pytest.mark.parametrize("size", [1, 7, 511, 512, 513, 1024, 4096])
+def test_allocate_storage(scratch_dirpath: Path, size: int):
+    with _example_dirpath(scratch_dirpath) as temp_dirpath:
+        to_path = temp_dirpath.joinpath("allocated")
         assert to_path.is_file() == False
 
         result_path = allocate_storage(to_path, size)
@@ -45,10 +72,12 @@ def test_allocate_storage(filename: str, size: int):
         assert result_path.stat().st_size == size
 
 
-@given(pythonic_name(), pythonic_name(), integers(min_value=1, max_value=1024))
-def test_allocate_storage_creates_parents(parent_name: str, filename: str, size: int):
-    with TemporaryDirectory() as temp_dir:
-        parent_path = Path(temp_dir).joinpath(parent_name)
+@given(pythonic_name(), pythonic_name(), _SIZE_STRATEGY)
+def test_allocate_storage_creates_parents(
+    scratch_dirpath: Path, parent_name: str, filename: str, size: int
+):
+    with _example_dirpath(scratch_dirpath) as temp_dirpath:
+        parent_path = temp_dirpath.joinpath(parent_name)
         assert parent_path.is_dir() == False
 
         to_path = parent_path.joinpath(filename)
@@ -59,15 +88,64 @@ def test_allocate_storage_creates_parents(parent_name: str, filename: str, size:
         assert result_path.stat().st_size == size
 
 
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fallocate"), reason="posix_fallocate is not available"
+)
+@given(pythonic_name(), _SIZE_STRATEGY)
+def test_allocate_storage_falls_back_when_fallocate_fails(
+    scratch_dirpath: Path, filename: str, size: int
+):
+    with _example_dirpath(scratch_dirpath) as temp_dirpath, patch(
+        "megu.utils.os.posix_fallocate",
+        side_effect=OSError(errno.EOPNOTSUPP, os.strerror(errno.EOPNOTSUPP)),
+    ) as mocked:
+        result_path = allocate_storage(temp_dirpath.joinpath(filename), size)
+        mocked.assert_called_once()
+        assert result_path.stat().st_size == size
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fallocate"), reason="posix_fallocate is not available"
+)
+@given(pythonic_name(), _SIZE_STRATEGY)
+def test_allocate_storage_raises_OSError_when_out_of_space(
+    scratch_dirpath: Path, filename: str, size: int
+):
+    with _example_dirpath(scratch_dirpath) as temp_dirpath, patch(
+        "megu.utils.os.posix_fallocate",
+        side_effect=OSError(errno.ENOSPC, os.strerror(errno.ENOSPC)),
+    ):
+        to_path = temp_dirpath.joinpath(filename)
+        with pytest.raises(OSError) as exc_info:
+            allocate_storage(to_path, size)
+
+        assert exc_info.value.errno == errno.ENOSPC
+        assert to_path.exists() == False
+
+
 @given(pathlib_path(), integers(max_value=0))
 def test_allocate_storage_raises_ValueError(to_path: Path, size: int):
     with pytest.raises(ValueError):
         allocate_storage(to_path, size)
 
 
-@given(integers(min_value=1, max_value=1024))
-def test_allocate_storage_raises_FileExistsError(size: int):
-    with NamedTemporaryFile() as temp_file:
-        to_path = Path(temp_file.name)
-        with pytest.raises(FileExistsError):
-            allocate_storage(to_path, size)
+@given(_SIZE_STRATEGY)
+def test_allocate_storage_raises_FileExistsError(existing_filepath: Path, size: int):
+    with pytest.raises(FileExistsError):
+        allocate_storage(existing_filepath, size)
+
+
+@given(pythonic_name(), _SIZE_STRATEGY)
+def test_allocate_storage_leaves_file_created_before_open(
+    scratch_dirpath: Path, filename: str, size: int
+):
+    with _example_dirpath(scratch_dirpath) as temp_dirpath:
+        to_path = temp_dirpath.joinpath(filename)
+        to_path.write_bytes(b"existing")
+
+        # simulate another writer creating the file between the check and the open
+        with patch.object(Path, "exists", return_value=False):
+            with pytest.raises(FileExistsError):
+                allocate_storage(to_path, size)
+
+        assert to_path.read_bytes() == b"existing"